@@ -93,12 +93,23 @@ class Catalog:
         self._uri_sources: Dict[str, Source] = {}
         self._vocabularies: Dict[URI, Vocabulary] = {}
         self._schema_cache: Dict[Hashable, Dict[URI, JSONSchema]] = {}
+        self._schema_cache_version: int = 0
         self._enabled_formats: Set[str] = set()
 
     def __repr__(self) -> str:
         """Return `repr(self)`."""
         return f'{self.__class__.__name__}({self.name!r})'
 
+    @property
+    def schema_cache_version(self) -> int:
+        """A number that changes whenever a schema is added to or removed
+        from the catalog's schema caches.
+
+        Schema lookups that are remembered elsewhere should be discarded
+        when this value changes.
+        """
+        return self._schema_cache_version
+
     def add_uri_source(self, base_uri: Union[URI, None], source: Source) -> None:
         """Register a source for loading URI-identified JSON resources.
 
@@ -271,7 +282,7 @@ class Catalog:
         and elsewhere.
         """
         import_module('jschon.formats')
-        self._enabled_formats |= set(format_attr)
+        self._enabled_formats.update(format_attr)
 
     def is_format_enabled(self, format_attr) -> bool:
         """Return True if validation is enabled for `format_attr`,
@@ -295,6 +306,7 @@ class Catalog:
         """
         self._schema_cache.setdefault(cacheid, {})
         self._schema_cache[cacheid][uri] = schema
+        self._schema_cache_version += 1
 
     def del_schema(
             self,
@@ -309,6 +321,7 @@ class Catalog:
         """
         if cacheid in self._schema_cache:
             self._schema_cache[cacheid].pop(uri, None)
+            self._schema_cache_version += 1
 
     def get_schema(
             self,
@@ -389,3 +402,4 @@ class Catalog:
             yield cacheid
         finally:
             self._schema_cache.pop(cacheid, None)
+            self._schema_cache_version += 1
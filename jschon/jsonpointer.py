@@ -174,7 +174,11 @@ class JSONPointer(Sequence[str]):
 
     def __hash__(self) -> int:
         """Return `hash(self)`."""
-        return hash(tuple(self._keys))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(tuple(self._keys))
+            return self._hash
 
     def __str__(self) -> str:
         """Return `str(self)`."""
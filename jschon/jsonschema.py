@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from collections import deque
-from contextlib import contextmanager
 from functools import cached_property
-from typing import Any, ContextManager, Dict, Hashable, Iterator, Mapping, Optional, TYPE_CHECKING, Tuple, Type, Union
+from typing import Any, ContextManager, Dict, FrozenSet, Hashable, Iterator, Mapping, Optional, TYPE_CHECKING, Tuple, Type, Union
 from uuid import uuid4
 
 from jschon.exc import JSONSchemaError
@@ -71,6 +70,18 @@ class JSONSchema(JSON):
         """A dictionary of the schema's :class:`~jschon.vocabulary.Keyword`
         objects, indexed by keyword name."""
 
+        # (key, keyword, instance_types) for each non-static keyword,
+        # in evaluation order; fixed once the keywords have been created
+        self._evaluation_plan: Tuple[Tuple[str, Keyword, Tuple[str, ...]], ...] = ()
+
+        # names of keywords on which another of the schema's keywords depends
+        self._dependency_keys: FrozenSet[str] = frozenset()
+
+        # true for a schema that passes any instance without producing any
+        # annotations or child results: the boolean schema true, or an object
+        # schema without any keywords to evaluate
+        self._always_valid: bool = False
+
         # do not call super().__init__
         # all inherited attributes are initialized here:
 
@@ -97,6 +108,7 @@ class JSONSchema(JSON):
         if isinstance(value, bool):
             self.type = "boolean"
             self.data = value
+            self._always_valid = value
 
         elif isinstance(value, Mapping):
             self.type = "object"
@@ -118,6 +130,18 @@ class JSONSchema(JSON):
                 self.keywords[key] = kw
                 self.data[key] = kw.json
 
+            self._evaluation_plan = tuple(
+                (key, kw, kw.instance_types)
+                for key, kw in self.keywords.items()
+                if not kw.static
+            )
+            self._always_valid = not self._evaluation_plan
+            self._dependency_keys = frozenset(
+                dependency
+                for kw in self.keywords.values()
+                for dependency in kw.depends_on
+            )
+
             if self.parent is None:
                 self._resolve_references()
 
@@ -188,15 +212,20 @@ class JSONSchema(JSON):
         """Validate the schema against its metaschema."""
         return self.metaschema.evaluate(self)
 
-    def evaluate(self, instance: JSON, result: Result = None) -> Result:
+    def evaluate(self, instance: JSON, result: Result = None, *, collect_annotations: bool = True) -> Result:
         """Evaluate a JSON document and return the evaluation result.
 
         :param instance: the JSON document to evaluate
         :param result: the current result node; given by keywords
             when invoking this method recursively
+        :param collect_annotations: if false, only the validity of the
+            result is of interest, and keywords such as ``anyOf`` may stop
+            evaluating subschemas once the outcome is known; annotations
+            are then incomplete, except where required by other keywords
+            (e.g. ``unevaluatedProperties``); ignored if `result` is given
         """
         if result is None:
-            result = Result(self, instance)
+            result = Result(self, instance, collect_annotations=collect_annotations)
 
         if self.data is True:
             pass
@@ -205,16 +234,22 @@ class JSONSchema(JSON):
             result.fail("The instance is disallowed by a boolean false schema")
 
         else:
-            for key, keyword in self.keywords.items():
-                if not keyword.static and instance.type in keyword.instance_types:
+            # only the keyword results created here are checked, rather than
+            # all of result's children; the latter may include the results of
+            # other instances evaluated against the same result node (e.g. by
+            # "items"), which would make this check quadratic
+            subresults = []
+            instance_type = instance.type
+            for key, keyword, instance_types in self._evaluation_plan:
+                if instance_type in instance_types:
                     with result(instance, key, self) as subresult:
                         keyword.evaluate(instance, subresult)
+                        subresults.append(subresult)
 
-            if any(
-                    not child.passed
-                    for child in result.children.values()
-                    if child.instance.path == instance.path
-            ):
+            # a keyword may alter the outcome of a previously evaluated sibling
+            # (e.g. "minContains" may pass "contains"), so outcomes are only
+            # checked once all keywords have been evaluated
+            if any(not subresult.passed and not subresult._discard for subresult in subresults):
                 result.fail()
 
         return result
@@ -355,6 +390,7 @@ class Result:
             *,
             parent: Result = None,
             key: str = None,
+            collect_annotations: bool = True,
     ) -> None:
         self.path: JSONPointer
         """The dynamic evaluation path to the current schema node."""
@@ -380,8 +416,8 @@ class Result:
         self.annotation: JSONCompatible = None
         """The annotation value of the result."""
 
-        self.error: JSONCompatible = None
-        """The error value of the result."""
+        self._error: JSONCompatible = None
+        self._error_args: Tuple[Any, ...] = ()
 
         self._valid = True
         self._assert = True
@@ -392,12 +428,20 @@ class Result:
             self.path = JSONPointer()
             self.relpath = JSONPointer()
             self._globals = {}
+            self._root = self
+            # evaluations that may be replayed elsewhere in the result tree,
+            # indexed by (id(schema), id(instance)); see evaluate_cached()
+            self._evaluation_cache: Dict[Tuple[int, int], Tuple[Result, Tuple]] = {}
+            self._scope_reads = 0
+            # whether all annotations are to be collected; if not, evaluation
+            # need only establish validity (see annotations_required())
+            self._annotations_collected = collect_annotations
         else:
             self.path = parent.path / key
             self.relpath = parent.relpath / key if schema is parent.schema else JSONPointer((key,))
             self._globals = None
+            self._root = parent._root
 
-    @contextmanager
     def __call__(
             self,
             instance: JSON,
@@ -406,12 +450,12 @@ class Result:
             *,
             cls: Type[Result] = None,
     ) -> ContextManager[Result]:
-        """Yield a subresult for the evaluation of `instance`.
-        Descend down the evaluation path by `key`, into `schema` if given, or
-        within `self.schema` otherwise.
+        """Return a subresult for the evaluation of `instance`, for use
+        as a context manager. Descend down the evaluation path by `key`, into
+        `schema` if given, or within `self.schema` otherwise.
 
         Extension keywords may provide a custom :class:`Result` class via `cls`,
-        which is applied to all nodes within the yielded subtree.
+        which is applied to all nodes within the returned subtree.
         """
         if schema is None:
             schema = self.schema
@@ -422,19 +466,20 @@ class Result:
             parent=self,
             key=key,
         ))
+        return child
 
-        try:
-            yield child
-        finally:
-            if child._discard:
-                del self.children[key, instance.path]
+    def __enter__(self) -> Result:
+        return self
 
-    @cached_property
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # a subresult is its own context manager, which is cheaper than
+        # a generator-based one; on exit it is removed if discarded
+        if self._discard:
+            del self.parent.children[self.key, self.instance.path]
+
+    @property
     def globals(self) -> Dict:
-        root = self
-        while root.parent is not None:
-            root = root.parent
-        return root._globals
+        return self._root._globals
 
     @cached_property
     def schema_node(self) -> JSON:
@@ -448,14 +493,109 @@ class Result:
         except KeyError:
             return None
 
+    def annotations_required(self) -> bool:
+        """Return whether annotations produced within this result node
+        may be required, either for the evaluation output or by a keyword
+        that has yet to be evaluated.
+
+        The former is the case unless the evaluation was started with
+        ``collect_annotations=False``. The latter is the case if, anywhere
+        in the dynamic scope of the current instance, a keyword depends on
+        the keyword under which this node (or one of its ancestors) was
+        created; for example, an ``unevaluatedProperties`` keyword which
+        depends on ``allOf``.
+        """
+        if self._root._annotations_collected:
+            return True
+
+        instance_path = self.instance.path
+        for node in self.dynamic_scope():
+            if node.parent is None or node.instance.path != instance_path:
+                break
+            if node.key in node.schema._dependency_keys:
+                return True
+        return False
+
+    def dynamic_scope(self) -> Iterator[Result]:
+        """Yield this result node followed by each of its ancestors.
+
+        A keyword whose evaluation depends on anything outside of its own
+        subtree (such as ``$dynamicRef``, which searches the dynamic scope for
+        a matching anchor) must walk the tree using this method, so that the
+        enclosing evaluation is not reused by :meth:`evaluate_cached`.
+        """
+        self._root._scope_reads += 1
+        node = self
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def evaluate_cached(self, schema: JSONSchema) -> Result:
+        """Evaluate this node's instance against `schema`, within this node.
+
+        If the same schema has already been evaluated against the same
+        instance elsewhere in the result tree, that evaluation is replayed
+        into this node instead of being repeated. Evaluations that consult
+        the :meth:`dynamic_scope` are never reused.
+        """
+        root = self._root
+        cache_key = id(schema), id(self.instance)
+        if (cached := root._evaluation_cache.get(cache_key)) is not None:
+            self._replay(*cached)
+            return self
+
+        scope_reads = root._scope_reads
+        schema.evaluate(self.instance, self)
+        if root._scope_reads == scope_reads:
+            # the calling keyword may yet alter this node's own outcome (as "not"
+            # does), so that is recorded now; its descendants are complete
+            root._evaluation_cache[cache_key] = self, self._state()
+        return self
+
+    def _state(self) -> Tuple:
+        return (
+            self.annotation,
+            self._error,
+            self._error_args,
+            self._valid,
+            self._assert,
+            self._discard,
+            self._refschema,
+        )
+
+    def _replay(self, source: Result, state: Tuple) -> None:
+        (
+            self.annotation,
+            self._error,
+            self._error_args,
+            self._valid,
+            self._assert,
+            self._discard,
+            self._refschema,
+        ) = state
+        for (key, instance_path), source_child in source.children.items():
+            self.children[key, instance_path] = (child := source_child.__class__(
+                source_child.schema,
+                source_child.instance,
+                parent=self,
+                key=key,
+            ))
+            child._replay(source_child, source_child._state())
+
     def annotate(self, value: JSONCompatible) -> None:
         """Annotate the result."""
         self.annotation = value
 
-    def fail(self, error: JSONCompatible = None) -> None:
-        """Mark the result as invalid, optionally with an error."""
+    def fail(self, error: JSONCompatible = None, *args: Any) -> None:
+        """Mark the result as invalid, optionally with an error.
+
+        If `args` are given, `error` is taken to be a :meth:`str.format`
+        template, which is only formatted if and when the error is read;
+        most failures (e.g. within ``anyOf`` or ``not``) never are.
+        """
         self._valid = False
-        self.error = error
+        self._error = error
+        self._error_args = args
 
     def pass_(self) -> None:
         """Mark the result as valid.
@@ -464,7 +604,8 @@ class Result:
         to be called by a keyword when it must reverse a failure.
         """
         self._valid = True
-        self.error = None
+        self._error = None
+        self._error_args = ()
 
     def noassert(self) -> None:
         """Indicate that evaluation passes regardless of validity."""
@@ -482,6 +623,19 @@ class Result:
         """
         self._refschema = schema
 
+    @property
+    def error(self) -> JSONCompatible:
+        """The error value of the result."""
+        if self._error_args:
+            self._error = self._error.format(*self._error_args)
+            self._error_args = ()
+        return self._error
+
+    @error.setter
+    def error(self, value: JSONCompatible) -> None:
+        self._error = value
+        self._error_args = ()
+
     @property
     def valid(self) -> bool:
         """Return the validity of the instance against the schema."""
@@ -515,13 +669,35 @@ class Result:
     def collect_annotations(self, instance: JSON = None, key: str = None) -> Iterator[JSONCompatible]:
         """Return an iterator over annotations produced in this subtree,
         optionally filtered by instance and/or keyword."""
+        keys = (key,) if key is not None else None
+        for _, annotation in self._collect_annotations(instance.path if instance is not None else None, keys):
+            yield annotation
+
+    def collect_annotations_by_key(self, instance: JSON, *keys: str) -> Iterator[Tuple[str, JSONCompatible]]:
+        """Return an iterator over (key, annotation) pairs produced in this
+        subtree for `instance` by any of the given keywords.
+
+        This traverses the subtree once, however many keywords are given.
+        """
+        return self._collect_annotations(instance.path, keys)
+
+    def _collect_annotations(
+            self,
+            instance_path: Optional[JSONPointer],
+            keys: Optional[Tuple[str, ...]],
+    ) -> Iterator[Tuple[str, JSONCompatible]]:
         if self._valid and not self._discard:
-            if self.annotation is not None and \
-                    (key is None or key == self.key) and \
-                    (instance is None or instance.path == self.instance.path):
-                yield self.annotation
-            for child in self.children.values():
-                yield from child.collect_annotations(instance, key)
+            if instance_path is None or instance_path == self.instance.path:
+                if self.annotation is not None and (keys is None or self.key in keys):
+                    yield self.key, self.annotation
+                for child in self.children.values():
+                    # a child evaluating a different (i.e. nested) instance
+                    # cannot produce annotations for this instance
+                    if instance_path is None or instance_path == child.instance.path:
+                        yield from child._collect_annotations(instance_path, keys)
+            else:
+                for child in self.children.values():
+                    yield from child._collect_annotations(instance_path, keys)
 
     def collect_errors(self, instance: JSON = None, key: str = None) -> Iterator[JSONCompatible]:
         """Return an iterator over errors produced in this subtree,
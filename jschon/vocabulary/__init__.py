@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import inspect
 import re
-from typing import Any, Dict, Mapping, Optional, Sequence, TYPE_CHECKING, Tuple, Type
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Sequence, TYPE_CHECKING, Tuple, Type
 
 from jschon.exc import JSONSchemaError
 from jschon.json import JSON, JSONCompatible
@@ -115,9 +116,9 @@ class Vocabulary:
 
     def __init__(self, uri: URI, *kwclasses: KeywordClass):
         self.uri: URI = uri
-        self.kwclasses: Dict[str, KeywordClass] = {
+        self.kwclasses: Mapping[str, KeywordClass] = MappingProxyType({
             kwclass.key: kwclass for kwclass in kwclasses
-        }
+        })
 
     def __repr__(self) -> str:
         """Return `repr(self)`."""
@@ -125,6 +126,8 @@ class Vocabulary:
 
 
 class Keyword:
+    __slots__ = ('json', 'parentschema', '_sibling_keys')
+
     key: str = ...
     """The keyword name as it appears in a schema object."""
 
@@ -138,6 +141,12 @@ class Keyword:
     """`static = True` (equivalent to `instance_types = ()`) indicates that the keyword
     does not ever evaluate any instance."""
 
+    fail_fast: bool = False
+    """`fail_fast = True` allows a keyword that applies several subschemas, or that
+    applies a subschema to several values, all of which must pass, to stop at the
+    first failure, reporting only that failure. Subschemas are always evaluated in
+    the order in which they are declared."""
+
     def __init__(self, parentschema: JSONSchema, value: JSONCompatible):
         for base_cls in inspect.getmro(self.__class__):
             if issubclass(base_cls, SubschemaMixin):
@@ -149,6 +158,13 @@ class Keyword:
         self.json: JSON = kwjson
         self.parentschema: JSONSchema = parentschema
 
+        # keywords are created in dependency order, so we already know which of
+        # our dependencies are present in the schema; a sibling result lookup
+        # for any other dependency is bound to fail
+        self._sibling_keys: FrozenSet[str] = frozenset(
+            key for key in self.depends_on if key in parentschema.keywords
+        )
+
     def evaluate(self, instance: JSON, result: Result) -> None:
         pass
 
@@ -160,12 +176,20 @@ KeywordClass = Type[Keyword]
 
 
 class _UnknownKeyword(Keyword):
+    __slots__ = ('_value',)
+
+    def __init__(self, parentschema: JSONSchema, value: JSONCompatible):
+        super().__init__(parentschema, value)
+        self._value = self.json.value
+
     def evaluate(self, instance: JSON, result: Result) -> None:
-        result.annotate(self.json.value)
+        result.annotate(self._value)
         result.noassert()
 
 
 class SubschemaMixin:
+    __slots__ = ()
+
     @classmethod
     def jsonify(cls, parentschema: JSONSchema, key: str, value: JSONCompatible) -> Optional[JSON]:
         raise NotImplementedError
@@ -175,6 +199,8 @@ class Subschema(SubschemaMixin):
     """A :class:`~Keyword` class mixin that sets up a subschema for
     a keyword."""
 
+    __slots__ = ()
+
     @classmethod
     def jsonify(cls, parentschema: JSONSchema, key: str, value: JSONCompatible) -> Optional[JSON]:
         if isinstance(value, (bool, Mapping)):
@@ -191,6 +217,8 @@ class ArrayOfSubschemas(SubschemaMixin):
     """A :class:`~Keyword` class mixin that sets up an array of subschemas
     for a keyword."""
 
+    __slots__ = ()
+
     @classmethod
     def jsonify(cls, parentschema: JSONSchema, key: str, value: JSONCompatible) -> Optional[JSON]:
         if isinstance(value, Sequence):
@@ -208,6 +236,8 @@ class ObjectOfSubschemas(SubschemaMixin):
     """A :class:`~Keyword` class mixin that sets up property-based subschemas
     for a keyword."""
 
+    __slots__ = ()
+
     @classmethod
     def jsonify(cls, parentschema: JSONSchema, key: str, value: JSONCompatible) -> Optional[JSON]:
         if isinstance(value, Mapping):
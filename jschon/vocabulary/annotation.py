@@ -1,5 +1,5 @@
-from jschon.json import JSON
-from jschon.jsonschema import Result
+from jschon.json import JSON, JSONCompatible
+from jschon.jsonschema import JSONSchema, Result
 from jschon.vocabulary import Keyword
 
 __all__ = [
@@ -17,57 +17,74 @@ __all__ = [
 
 
 class _AnnotationKeyword(Keyword):
+    __slots__ = ('_value',)
+
+    def __init__(self, parentschema: JSONSchema, value: JSONCompatible):
+        super().__init__(parentschema, value)
+        # the annotation value is fixed by the schema, so it is
+        # converted back to a Python object only once
+        self._value = self.json.value
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        result.annotate(self.json.value)
+        result.annotate(self._value)
         result.noassert()
 
 
 class TitleKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "title"
 
 
 class DescriptionKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "description"
 
 
 class DefaultKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "default"
 
 
 class DeprecatedKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "deprecated"
 
 
 class ReadOnlyKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "readOnly"
 
 
 class WriteOnlyKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "writeOnly"
 
 
 class ExamplesKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "examples"
 
 
 class ContentMediaTypeKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "contentMediaType"
     instance_types = "string",
 
 
 class ContentEncodingKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "contentEncoding"
     instance_types = "string",
 
 
 class ContentSchemaKeyword(_AnnotationKeyword):
+    __slots__ = ()
     key = "contentSchema"
     instance_types = "string",
     depends_on = "contentMediaType",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        if result.sibling(instance, "contentMediaType"):
+        if "contentMediaType" in self._sibling_keys and result.sibling(instance, "contentMediaType"):
             super().evaluate(instance, result)
         else:
             result.discard()
@@ -1,7 +1,10 @@
 import re
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Callable, Collection, Iterable, Mapping, Optional, Pattern, Sequence, Tuple, Union
 
-from jschon.json import JSON
-from jschon.jsonschema import Result
+from jschon.json import JSON, JSONCompatible
+from jschon.jsonschema import JSONSchema, Result
 from jschon.vocabulary import ArrayOfSubschemas, Keyword, ObjectOfSubschemas, Subschema
 
 __all__ = [
@@ -26,59 +29,134 @@ __all__ = [
 
 
 class AllOfKeyword(Keyword, ArrayOfSubschemas):
+    __slots__ = ('_subschemas',)
     key = "allOf"
 
+    def __init__(self, parentschema: JSONSchema, value: Sequence[JSONCompatible]):
+        super().__init__(parentschema, value)
+        self._subschemas: Tuple[Tuple[int, str, JSONSchema], ...] = _indexed_subschemas(self.json)
+
     def evaluate(self, instance: JSON, result: Result) -> None:
+        if len(subschemas := self._subschemas) == 1:
+            if subschemas[0][2]._always_valid and not result.annotations_required():
+                return
+            with result(instance, "0") as subresult:
+                if not subresult.evaluate_cached(subschemas[0][2]).passed:
+                    result.fail('The instance is invalid against subschemas {}', [0])
+            return
+
         err_indices = []
-        for index, subschema in enumerate(self.json):
-            with result(instance, str(index)) as subresult:
-                subschema.evaluate(instance, subresult)
+        for index, key, subschema in subschemas:
+            # an always-valid subschema is skipped unless its result
+            # belongs in the output
+            if subschema._always_valid and not result.annotations_required():
+                continue
+            with result(instance, key) as subresult:
+                subresult.evaluate_cached(subschema)
                 if not subresult.passed:
-                    err_indices += [index]
+                    err_indices.append(index)
+                    if self.fail_fast:
+                        break
 
         if err_indices:
-            result.fail(f'The instance is invalid against subschemas {err_indices}')
+            result.fail('The instance is invalid against subschemas {}', err_indices)
 
 
 class AnyOfKeyword(Keyword, ArrayOfSubschemas):
+    __slots__ = ('_subschemas', '_any_always_valid')
     key = "anyOf"
 
+    def __init__(self, parentschema: JSONSchema, value: Sequence[JSONCompatible]):
+        super().__init__(parentschema, value)
+        self._subschemas: Tuple[Tuple[int, str, JSONSchema], ...] = _indexed_subschemas(self.json)
+        # if any subschema is always valid, so is anyOf; the others need only
+        # be evaluated if their annotations are to be collected
+        self._any_always_valid: bool = any(subschema._always_valid for _, _, subschema in self._subschemas)
+
     def evaluate(self, instance: JSON, result: Result) -> None:
-        valid = False
-        for index, subschema in enumerate(self.json):
-            with result(instance, str(index)) as subresult:
-                subschema.evaluate(instance, subresult)
-                if subresult.passed:
-                    valid = True
+        if self._any_always_valid and not result.annotations_required():
+            return
+
+        if len(subschemas := self._subschemas) == 1 and not self._any_always_valid:
+            with result(instance, "0") as subresult:
+                if not subresult.evaluate_cached(subschemas[0][2]).passed:
+                    result.fail('The instance must be valid against at least one subschema')
+            return
+
+        valid = self._any_always_valid
+        for index, key, subschema in subschemas:
+            if subschema._always_valid and not result.annotations_required():
+                continue
+            with result(instance, key) as subresult:
+                subresult.evaluate_cached(subschema)
+
+            if subresult.passed and not valid:
+                valid = True
+                # annotations from every valid subschema must be collected,
+                # unless only the validity of the evaluation is of interest
+                if not result.annotations_required():
+                    break
 
         if not valid:
-            result.fail(f'The instance must be valid against at least one subschema')
+            result.fail('The instance must be valid against at least one subschema')
 
 
 class OneOfKeyword(Keyword, ArrayOfSubschemas):
+    __slots__ = ('_subschemas',)
     key = "oneOf"
 
+    collect_all_results: bool = False
+    """If true, every subschema is evaluated, so that a failure reports all the
+    subschemas against which the instance is valid and invalid. Otherwise,
+    if annotations are not required (as in an evaluation with
+    ``collect_annotations=False``), evaluation stops once the instance is
+    found to be valid against two subschemas, since the keyword has then
+    failed regardless of the rest."""
+
+    def __init__(self, parentschema: JSONSchema, value: Sequence[JSONCompatible]):
+        super().__init__(parentschema, value)
+        self._subschemas: Tuple[Tuple[int, str, JSONSchema], ...] = _indexed_subschemas(self.json)
+
     def evaluate(self, instance: JSON, result: Result) -> None:
+        if len(subschemas := self._subschemas) == 1:
+            if subschemas[0][2]._always_valid and not result.annotations_required():
+                return
+            with result(instance, "0") as subresult:
+                if not subresult.evaluate_cached(subschemas[0][2]).passed:
+                    result.fail('The instance must be valid against exactly one subschema; '
+                                'it is valid against {} and invalid against {}', [], [0])
+            return
+
         valid_indices = []
         err_indices = []
-        for index, subschema in enumerate(self.json):
-            with result(instance, str(index)) as subresult:
-                subschema.evaluate(instance, subresult)
-                if subresult.passed:
-                    valid_indices += [index]
-                else:
-                    err_indices += [index]
+        for index, key, subschema in subschemas:
+            if subschema._always_valid and not result.annotations_required():
+                valid_indices.append(index)
+            else:
+                with result(instance, key) as subresult:
+                    subresult.evaluate_cached(subschema)
+                    if subresult.passed:
+                        valid_indices.append(index)
+                    else:
+                        err_indices.append(index)
+
+            if len(valid_indices) > 1 and not self.collect_all_results and \
+                    not result.annotations_required():
+                result.fail('The instance must be valid against exactly one subschema; '
+                            'it is valid against at least {}', valid_indices)
+                return
 
         if len(valid_indices) != 1:
             result.fail('The instance must be valid against exactly one subschema; '
-                        f'it is valid against {valid_indices} and invalid against {err_indices}')
+                        'it is valid against {} and invalid against {}', valid_indices, err_indices)
 
 
 class NotKeyword(Keyword, Subschema):
+    __slots__ = ()
     key = "not"
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        self.json.evaluate(instance, result)
+        result.evaluate_cached(self.json)
 
         if result.passed:
             result.fail('The instance must not be valid against the subschema')
@@ -87,6 +165,7 @@ class NotKeyword(Keyword, Subschema):
 
 
 class IfKeyword(Keyword, Subschema):
+    __slots__ = ()
     key = "if"
 
     def evaluate(self, instance: JSON, result: Result) -> None:
@@ -95,62 +174,79 @@ class IfKeyword(Keyword, Subschema):
 
 
 class ThenKeyword(Keyword, Subschema):
+    __slots__ = ()
     key = "then"
     depends_on = "if",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        if (if_ := result.sibling(instance, "if")) and if_.valid:
+        if "if" in self._sibling_keys and (if_ := result.sibling(instance, "if")) and if_.valid:
             self.json.evaluate(instance, result)
         else:
             result.discard()
 
 
 class ElseKeyword(Keyword, Subschema):
+    __slots__ = ()
     key = "else"
     depends_on = "if",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        if (if_ := result.sibling(instance, "if")) and not if_.valid:
+        if "if" in self._sibling_keys and (if_ := result.sibling(instance, "if")) and not if_.valid:
             self.json.evaluate(instance, result)
         else:
             result.discard()
 
 
 class DependentSchemasKeyword(Keyword, ObjectOfSubschemas):
+    __slots__ = ('_subschemas',)
     key = "dependentSchemas"
     instance_types = "object",
 
+    def __init__(self, parentschema: JSONSchema, value: Mapping[str, JSONCompatible]):
+        super().__init__(parentschema, value)
+        self._subschemas: Tuple[Tuple[str, JSONSchema], ...] = tuple(self.json.items())
+
     def evaluate(self, instance: JSON, result: Result) -> None:
         annotation = []
         err_names = []
-        for name, subschema in self.json.items():
-            if name in instance:
+        properties = instance.data
+        for name, subschema in self._subschemas:
+            if name in properties:
                 with result(instance, name) as subresult:
                     subschema.evaluate(instance, subresult)
                     if subresult.passed:
-                        annotation += [name]
+                        annotation.append(name)
                     else:
-                        err_names += [name]
+                        err_names.append(name)
+                        if self.fail_fast:
+                            break
 
         if err_names:
-            result.fail(f'Properties {err_names} are invalid against '
-                        f'the corresponding "dependentSchemas" subschemas')
+            result.fail('Properties {} are invalid against '
+                        'the corresponding "dependentSchemas" subschemas', err_names)
         else:
             result.annotate(annotation)
 
 
 class PrefixItemsKeyword(Keyword, ArrayOfSubschemas):
+    __slots__ = ('_subschemas',)
     key = "prefixItems"
     instance_types = "array",
 
+    def __init__(self, parentschema: JSONSchema, value: Sequence[JSONCompatible]):
+        super().__init__(parentschema, value)
+        self._subschemas: Tuple[Tuple[int, str, JSONSchema], ...] = _indexed_subschemas(self.json)
+
     def evaluate(self, instance: JSON, result: Result) -> None:
         annotation = None
         error = []
-        for index, item in enumerate(instance[:len(self.json)]):
+        for item, (index, key, subschema) in zip(instance, self._subschemas):
             annotation = index
-            with result(item, str(index)) as subresult:
-                if not self.json[index].evaluate(item, subresult).passed:
-                    error += [index]
+            if subschema._always_valid and not result.annotations_required():
+                continue
+            with result(item, key) as subresult:
+                if not subschema.evaluate(item, subresult).passed:
+                    error.append(index)
 
         if error:
             result.fail(error)
@@ -161,23 +257,28 @@ class PrefixItemsKeyword(Keyword, ArrayOfSubschemas):
 
 
 class ItemsKeyword(Keyword, Subschema):
+    __slots__ = ('_start_index',)
     key = "items"
     instance_types = "array",
     depends_on = "prefixItems",
 
-    def evaluate(self, instance: JSON, result: Result) -> None:
-        if prefix_items := result.sibling(instance, "prefixItems"):
-            start_index = len(prefix_items.schema_node)
-        else:
-            start_index = 0
+    def __init__(self, parentschema: JSONSchema, value: Union[bool, Mapping[str, JSONCompatible]]):
+        super().__init__(parentschema, value)
+        # an adjacent "prefixItems" is evaluated against every array
+        # instance, so the items it covers are known in advance
+        self._start_index: int = len(parentschema.keywords["prefixItems"].json) \
+            if "prefixItems" in self._sibling_keys else 0
 
+    def evaluate(self, instance: JSON, result: Result) -> None:
+        start_index = self._start_index
         annotation = None
         error = []
-        for index, item in enumerate(instance[start_index:], start_index):
-            if self.json.evaluate(item, result).passed:
+        evaluate_item = self.json.evaluate
+        for index, item in enumerate(islice(instance, start_index, None), start_index):
+            if evaluate_item(item, result).passed:
                 annotation = True
             else:
-                error += [index]
+                error.append(index)
                 # reset to passed for the next iteration
                 result.pass_()
 
@@ -188,6 +289,7 @@ class ItemsKeyword(Keyword, Subschema):
 
 
 class UnevaluatedItemsKeyword(Keyword, Subschema):
+    __slots__ = ()
     key = "unevaluatedItems"
     instance_types = "array",
     depends_on = (
@@ -207,35 +309,27 @@ class UnevaluatedItemsKeyword(Keyword, Subschema):
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         last_evaluated_item = -1
-        for prefix_items_annotation in result.parent.collect_annotations(instance, "prefixItems"):
-            if prefix_items_annotation is True:
-                result.discard()
-                return
-            if prefix_items_annotation > last_evaluated_item:
-                last_evaluated_item = prefix_items_annotation
-
-        for items_annotation in result.parent.collect_annotations(instance, "items"):
-            if items_annotation is True:
-                result.discard()
-                return
-
-        for unevaluated_items_annotation in result.parent.collect_annotations(instance, "unevaluatedItems"):
-            if unevaluated_items_annotation is True:
+        contains_indices = set()
+        for key, annotation in result.parent.collect_annotations_by_key(
+                instance, "prefixItems", "items", "unevaluatedItems", "contains"
+        ):
+            if key == "contains":
+                contains_indices.update(annotation)
+            elif annotation is True:
                 result.discard()
                 return
-
-        contains_indices = set()
-        for contains_annotation in result.parent.collect_annotations(instance, "contains"):
-            contains_indices |= set(contains_annotation)
+            elif key == "prefixItems" and annotation > last_evaluated_item:
+                last_evaluated_item = annotation
 
         annotation = None
         error = []
-        for index, item in enumerate(instance[(start := last_evaluated_item + 1):], start):
+        evaluate_item = self.json.evaluate
+        for index, item in enumerate(islice(instance, (start := last_evaluated_item + 1), None), start):
             if index not in contains_indices:
-                if self.json.evaluate(item, result).passed:
+                if evaluate_item(item, result).passed:
                     annotation = True
                 else:
-                    error += [index]
+                    error.append(index)
                     # reset to passed for the next iteration
                     result.pass_()
 
@@ -246,94 +340,185 @@ class UnevaluatedItemsKeyword(Keyword, Subschema):
 
 
 class ContainsKeyword(Keyword, Subschema):
+    __slots__ = ('_limit',)
     key = "contains"
     instance_types = "array",
 
+    def __init__(self, parentschema: JSONSchema, value: Union[bool, Mapping[str, JSONCompatible]]):
+        super().__init__(parentschema, value)
+        # see _match_limit(); the adjacent keywords on which it depends are
+        # created after this one, so it is worked out on first use
+        self._limit: Union[int, None, object] = _UNSET
+
     def evaluate(self, instance: JSON, result: Result) -> None:
+        # the annotation lists every matching item; evaluation stops early
+        # only if the annotation is not needed, once enough matching items
+        # have been found to satisfy any adjacent "minContains" (or to exceed
+        # any adjacent "maxContains")
         annotation = []
+        match_limit = None
+        evaluate_item = self.json.evaluate
         for index, item in enumerate(instance):
-            if self.json.evaluate(item, result).passed:
-                annotation += [index]
+            if evaluate_item(item, result).passed:
+                annotation.append(index)
+                if len(annotation) == 1 and (match_limit := self._match_limit()) is not None and \
+                        result.parent.annotations_required():
+                    match_limit = None
+                if match_limit is not None and len(annotation) >= match_limit:
+                    break
             else:
                 result.pass_()
 
         result.annotate(annotation)
         if not annotation:
             result.fail('The array does not contain any element that is valid '
-                        f'against the "{self.key}" subschema')
+                        'against the "{}" subschema', self.key)
+
+    def _match_limit(self) -> Optional[int]:
+        """Return the number of matching items after which evaluation may
+        stop if the annotation is not otherwise needed, or None if all
+        matching items must be found."""
+        if self._limit is _UNSET:
+            self._limit = self._find_match_limit()
+        return self._limit
+
+    def _find_match_limit(self) -> Optional[int]:
+        min_contains = 1
+        max_contains = None
+        for key, keyword in self.parentschema.keywords.items():
+            if key == "minContains":
+                min_contains = keyword.json.data
+            elif key == "maxContains":
+                max_contains = keyword.json.data
+            elif self.key in keyword.depends_on:
+                return None
+
+        if max_contains is not None:
+            return max_contains + 1
+
+        return max(min_contains, 1)
 
 
 class PropertiesKeyword(Keyword, ObjectOfSubschemas):
+    __slots__ = ()
     key = "properties"
     instance_types = "object",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         annotation = []
         err_names = []
+        subschemas = self.json.data
         for name, item in instance.items():
-            if name in self.json:
+            if (subschema := subschemas.get(name)) is not None:
+                if subschema._always_valid and not result.annotations_required():
+                    annotation.append(name)
+                    continue
                 with result(item, name) as subresult:
-                    self.json[name].evaluate(item, subresult)
+                    subschema.evaluate(item, subresult)
                     if subresult.passed:
-                        annotation += [name]
+                        annotation.append(name)
                     else:
-                        err_names += [name]
+                        err_names.append(name)
 
         if err_names:
-            result.fail(f"Properties {err_names} are invalid")
+            result.fail("Properties {} are invalid", err_names)
         else:
             result.annotate(annotation)
 
 
 class PatternPropertiesKeyword(Keyword, ObjectOfSubschemas):
+    __slots__ = ('_patterns', '_any_pattern', '_match')
     key = "patternProperties"
     instance_types = "object",
 
+    _max_cached_matches = 1024
+
+    def __init__(self, parentschema: JSONSchema, value: Mapping[str, JSONCompatible]):
+        super().__init__(parentschema, value)
+        self._patterns: Tuple[Tuple[str, Pattern, JSONSchema], ...] = tuple(
+            (regex, re.compile(regex), subschema) for regex, subschema in self.json.items()
+        )
+        # if there are several patterns, a name that matches none of them
+        # can be passed over with a single search
+        any_pattern = _combine_patterns(self.json)
+        self._any_pattern: Optional[Pattern] = \
+            any_pattern[0] if len(any_pattern) == 1 < len(self._patterns) else None
+        # property names recur across instances (e.g. the items of an
+        # array of objects), so the patterns matching each name are
+        # remembered, in an LRU cache that may be shared between threads
+        self._match: Callable[[str], Tuple[Tuple[str, JSONSchema], ...]] = \
+            lru_cache(maxsize=self._max_cached_matches)(self._find_matches)
+
+    def _find_matches(self, name: str) -> Tuple[Tuple[str, JSONSchema], ...]:
+        if self._any_pattern is not None and self._any_pattern.search(name) is None:
+            return ()
+        return tuple(
+            (regex, subschema) for regex, pattern, subschema in self._patterns
+            if pattern.search(name) is not None
+        )
+
     def evaluate(self, instance: JSON, result: Result) -> None:
-        matched_names = set()
+        # a dict, rather than a set, keeps the matched names in instance order
+        matched_names = {}
         err_names = []
+        match = self._match
         for name, item in instance.items():
-            for regex, subschema in self.json.items():
-                if re.search(regex, name) is not None:
-                    with result(item, regex) as subresult:
-                        subschema.evaluate(item, subresult)
-                        if subresult.passed:
-                            matched_names |= {name}
-                        else:
-                            err_names += [name]
+            for regex, subschema in match(name):
+                if subschema._always_valid and not result.annotations_required():
+                    matched_names[name] = None
+                    continue
+                with result(item, regex) as subresult:
+                    subschema.evaluate(item, subresult)
+                    if subresult.passed:
+                        matched_names[name] = None
+                    else:
+                        err_names.append(name)
 
         if err_names:
-            result.fail(f"Properties {err_names} are invalid")
+            result.fail("Properties {} are invalid", err_names)
         else:
             result.annotate(list(matched_names))
 
 
 class AdditionalPropertiesKeyword(Keyword, Subschema):
+    __slots__ = ('_property_names', '_property_patterns')
     key = "additionalProperties"
     instance_types = "object",
     depends_on = "properties", "patternProperties",
 
-    def evaluate(self, instance: JSON, result: Result) -> None:
-        if properties := result.sibling(instance, "properties"):
-            known_property_names = properties.schema_node.keys()
-        else:
-            known_property_names = ()
+    def __init__(self, parentschema: JSONSchema, value: Union[bool, Mapping[str, JSONCompatible]]):
+        super().__init__(parentschema, value)
+        self._property_names: Collection[str] = parentschema.keywords["properties"].json.data.keys() \
+            if "properties" in self._sibling_keys else ()
+        self._property_patterns: Tuple[Pattern, ...] = _combine_patterns(
+            parentschema.keywords["patternProperties"].json
+        ) if "patternProperties" in self._sibling_keys else ()
 
-        if pattern_properties := result.sibling(instance, "patternProperties"):
-            known_property_patterns = pattern_properties.schema_node.keys()
-        else:
-            known_property_patterns = ()
+    def evaluate(self, instance: JSON, result: Result) -> None:
+        known_property_names = self._property_names
+        matched_property_names = ()
+        known_property_patterns = ()
+        if "patternProperties" in self._sibling_keys and \
+                (pattern_properties := result.sibling(instance, "patternProperties")):
+            if pattern_properties.valid:
+                # a valid "patternProperties" result is annotated with every
+                # property name that matches one of its patterns, so we need
+                # not match the patterns again
+                matched_property_names = frozenset(pattern_properties.annotation)
+            else:
+                known_property_patterns = self._property_patterns
 
         annotation = []
         error = []
+        evaluate_item = self.json.evaluate
         for name, item in instance.items():
-            if name not in known_property_names and not any(
-                    re.search(regex, name) for regex in known_property_patterns
+            if name not in known_property_names and name not in matched_property_names and not any(
+                    pattern.search(name) for pattern in known_property_patterns
             ):
-                if self.json.evaluate(item, result).passed:
-                    annotation += [name]
+                if evaluate_item(item, result).passed:
+                    annotation.append(name)
                 else:
-                    error += [name]
+                    error.append(name)
                     # reset to passed for the next iteration
                     result.pass_()
 
@@ -344,6 +529,7 @@ class AdditionalPropertiesKeyword(Keyword, Subschema):
 
 
 class UnevaluatedPropertiesKeyword(Keyword, Subschema):
+    __slots__ = ('_adjacent_keys',)
     key = "unevaluatedProperties"
     instance_types = "object",
     depends_on = (
@@ -362,25 +548,38 @@ class UnevaluatedPropertiesKeyword(Keyword, Subschema):
         "$dynamicRef",
     )
 
+    def __init__(self, parentschema: JSONSchema, value: Union[bool, Mapping[str, JSONCompatible]]):
+        super().__init__(parentschema, value)
+        # when "additionalProperties" is adjacent, every property of the instance
+        # has been evaluated by these keywords if all of them have passed
+        self._adjacent_keys: Optional[Tuple[str, ...]] = tuple(
+            key for key in ("properties", "patternProperties", "additionalProperties")
+            if key in self._sibling_keys
+        ) if "additionalProperties" in self._sibling_keys else None
+
     def evaluate(self, instance: JSON, result: Result) -> None:
-        evaluated_names = set()
-        for properties_annotation in result.parent.collect_annotations(instance, "properties"):
-            evaluated_names |= set(properties_annotation)
-        for pattern_properties_annotation in result.parent.collect_annotations(instance, "patternProperties"):
-            evaluated_names |= set(pattern_properties_annotation)
-        for additional_properties_annotation in result.parent.collect_annotations(instance, "additionalProperties"):
-            evaluated_names |= set(additional_properties_annotation)
-        for unevaluated_properties_annotation in result.parent.collect_annotations(instance, "unevaluatedProperties"):
-            evaluated_names |= set(unevaluated_properties_annotation)
+        if self._adjacent_keys is not None and all(
+                (sibling := result.sibling(instance, key)) is not None and sibling.valid
+                for key in self._adjacent_keys
+        ):
+            result.annotate([])
+            return
+
+        evaluated_names = frozenset(chain.from_iterable(
+            annotation for _, annotation in result.parent.collect_annotations_by_key(
+                instance, "properties", "patternProperties", "additionalProperties", "unevaluatedProperties"
+            )
+        ))
 
         annotation = []
         error = []
+        evaluate_item = self.json.evaluate
         for name, item in instance.items():
             if name not in evaluated_names:
-                if self.json.evaluate(item, result).passed:
-                    annotation += [name]
+                if evaluate_item(item, result).passed:
+                    annotation.append(name)
                 else:
-                    error += [name]
+                    error.append(name)
                     # reset to passed for the next iteration
                     result.pass_()
 
@@ -391,15 +590,60 @@ class UnevaluatedPropertiesKeyword(Keyword, Subschema):
 
 
 class PropertyNamesKeyword(Keyword, Subschema):
+    __slots__ = ()
     key = "propertyNames"
     instance_types = "object",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         error = []
-        for name in instance:
-            if not self.json.evaluate(JSON(name, parent=instance, key=name), result).passed:
-                error += [name]
+        evaluate_name = self.json.evaluate
+        for name, item in instance.data.items():
+            if not evaluate_name(_PropertyName(name, item), result).passed:
+                error.append(name)
                 result.pass_()
+                if self.fail_fast:
+                    break
 
         if error:
             result.fail(error)
+
+
+_UNSET = object()
+
+
+def _indexed_subschemas(subschemas: JSON) -> Tuple[Tuple[int, str, JSONSchema], ...]:
+    # the result key for each subschema is its index as a string, built
+    # once here rather than on every evaluation
+    return tuple((index, str(index), subschema) for index, subschema in enumerate(subschemas))
+
+
+def _combine_patterns(regexes: Iterable[str]) -> Tuple[Pattern, ...]:
+    """Compile `regexes` into a single alternation, such that one search
+    tests all of them, if that does not change their meaning; i.e. if none
+    has inline flags (which would apply to the whole alternation) or groups
+    (whose back-references would be renumbered)."""
+    patterns = tuple(re.compile(regex) for regex in regexes)
+    if len(patterns) > 1 and not any(
+            pattern.groups or pattern.flags & ~re.UNICODE for pattern in patterns
+    ):
+        return re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in patterns)),
+    return patterns
+
+
+class _PropertyName(JSON):
+    """A property name, evaluated by ``propertyNames`` as a JSON string.
+
+    Construction skips the type detection done by :class:`JSON`. The path
+    is taken from the property value, which is at the same location and
+    usually has its path cached already.
+    """
+
+    def __init__(self, name: str, value: JSON):
+        # do not call super().__init__
+        self.type = "string"
+        self.data = name
+        self.parent = value.parent
+        self.key = name
+        self.itemclass = JSON
+        self.itemkwargs = {}
+        self.path = value.path
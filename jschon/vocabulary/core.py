@@ -1,4 +1,6 @@
-from typing import Mapping
+import re
+from functools import lru_cache
+from typing import Dict, Mapping, Optional
 
 from jschon.exc import CatalogError, JSONSchemaError, URIError
 from jschon.json import JSON
@@ -20,6 +22,7 @@ __all__ = [
 
 
 class SchemaKeyword(Keyword):
+    __slots__ = ()
     key = "$schema"
     static = True
 
@@ -27,7 +30,7 @@ class SchemaKeyword(Keyword):
         super().__init__(parentschema, value)
 
         try:
-            (uri := URI(value)).validate(require_scheme=True, require_normalized=True)
+            uri = _parse_absolute_uri(value)
         except URIError as e:
             raise JSONSchemaError from e
 
@@ -35,6 +38,7 @@ class SchemaKeyword(Keyword):
 
 
 class VocabularyKeyword(Keyword):
+    __slots__ = ()
     key = "$vocabulary"
     static = True
 
@@ -50,7 +54,7 @@ class VocabularyKeyword(Keyword):
 
         for vocab_uri, vocab_required in value.items():
             try:
-                (vocab_uri := URI(vocab_uri)).validate(require_scheme=True, require_normalized=True)
+                vocab_uri = _parse_absolute_uri(vocab_uri)
             except URIError as e:
                 raise JSONSchemaError from e
 
@@ -63,6 +67,7 @@ class VocabularyKeyword(Keyword):
 
 
 class IdKeyword(Keyword):
+    __slots__ = ()
     key = "$id"
     static = True
 
@@ -80,6 +85,7 @@ class IdKeyword(Keyword):
 
 
 class RefKeyword(Keyword):
+    __slots__ = ('refschema',)
     key = "$ref"
 
     def __init__(self, parentschema: JSONSchema, value: str):
@@ -87,7 +93,7 @@ class RefKeyword(Keyword):
         self.refschema = None
 
     def resolve(self) -> None:
-        uri = URI(self.json.data)
+        uri = _parse_uri(self.json.data)
         if not uri.has_absolute_base():
             if (base_uri := self.parentschema.base_uri) is not None:
                 uri = uri.resolve(base_uri)
@@ -99,11 +105,12 @@ class RefKeyword(Keyword):
         )
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        self.refschema.evaluate(instance, result)
+        result.evaluate_cached(self.refschema)
         result.refschema(self.refschema)
 
 
 class AnchorKeyword(Keyword):
+    __slots__ = ()
     key = "$anchor"
     static = True
 
@@ -111,7 +118,7 @@ class AnchorKeyword(Keyword):
         super().__init__(parentschema, value)
 
         if (base_uri := parentschema.base_uri) is not None:
-            uri = URI(f'{base_uri}#{value}')
+            uri = _anchor_uri(base_uri, value)
         else:
             raise JSONSchemaError(f'No base URI for "$anchor" value "{value}"')
 
@@ -119,17 +126,24 @@ class AnchorKeyword(Keyword):
 
 
 class DynamicRefKeyword(Keyword):
+    __slots__ = ('fragment', 'refschema', 'dynamic', '_fragment_uri', '_dynamic_targets', '_dynamic_targets_version')
     key = "$dynamicRef"
 
     def __init__(self, parentschema: JSONSchema, value: str):
         super().__init__(parentschema, value)
 
-        self.fragment = URI(value).fragment
+        self.fragment = _parse_uri(value).fragment
         self.refschema = None
         self.dynamic = False
+        # resolved against each base URI in the dynamic scope; parsed once
+        self._fragment_uri = URI(f"#{self.fragment}")
+        # the dynamic anchor target (if any) found under each base URI in
+        # the dynamic scope, valid for a given version of the schema cache
+        self._dynamic_targets: Dict[URI, Optional[JSONSchema]] = {}
+        self._dynamic_targets_version: int = -1
 
     def resolve(self) -> None:
-        uri = URI(self.json.data)
+        uri = _parse_uri(self.json.data)
         if not uri.has_absolute_base():
             if (base_uri := self.parentschema.base_uri) is not None:
                 uri = uri.resolve(base_uri)
@@ -146,30 +160,48 @@ class DynamicRefKeyword(Keyword):
         refschema = self.refschema
 
         if self.dynamic:
-            target = result
-            checked_uris = set()
+            if self._dynamic_targets_version != (version := self.parentschema.catalog.schema_cache_version):
+                self._dynamic_targets = {}
+                self._dynamic_targets_version = version
 
-            while target is not None:
-                if (base_uri := target.schema.base_uri) is not None and base_uri not in checked_uris:
-                    checked_uris |= {base_uri}
-                    target_uri = URI(f"#{self.fragment}").resolve(base_uri)
+            dynamic_targets = self._dynamic_targets
+            checked_uris = set()
+            checked_schema = None
+
+            for target in result.dynamic_scope():
+                # a schema node is followed in the scope by its keyword nodes,
+                # which share its base URI; it need only be checked once
+                if (schema := target.schema) is checked_schema:
+                    continue
+                checked_schema = schema
+                if (base_uri := schema.base_uri) is not None and base_uri not in checked_uris:
+                    checked_uris.add(base_uri)
                     try:
-                        found_schema = self.parentschema.catalog.get_schema(
-                            target_uri, cacheid=self.parentschema.cacheid
-                        )
-                        if (dynamic_anchor := found_schema.get("$dynamicAnchor")) and \
-                                dynamic_anchor.data == self.fragment:
-                            refschema = found_schema
-                    except CatalogError:
-                        pass
-
-                target = target.parent
+                        found_schema = dynamic_targets[base_uri]
+                    except KeyError:
+                        found_schema = dynamic_targets[base_uri] = self._find_dynamic_target(base_uri)
+                    if found_schema is not None:
+                        refschema = found_schema
 
         refschema.evaluate(instance, result)
         result.refschema(refschema)
 
+    def _find_dynamic_target(self, base_uri: URI) -> Optional[JSONSchema]:
+        try:
+            found_schema = self.parentschema.catalog.get_schema(
+                self._fragment_uri.resolve(base_uri), cacheid=self.parentschema.cacheid
+            )
+        except CatalogError:
+            return None
+
+        if (dynamic_anchor := found_schema.get("$dynamicAnchor")) and dynamic_anchor.data == self.fragment:
+            return found_schema
+
+        return None
+
 
 class DynamicAnchorKeyword(Keyword):
+    __slots__ = ()
     key = "$dynamicAnchor"
     static = True
 
@@ -177,7 +209,7 @@ class DynamicAnchorKeyword(Keyword):
         super().__init__(parentschema, value)
 
         if (base_uri := parentschema.base_uri) is not None:
-            uri = URI(f'{base_uri}#{value}')
+            uri = _anchor_uri(base_uri, value)
         else:
             raise JSONSchemaError(f'No base URI for "$dynamicAnchor" value "{value}"')
 
@@ -185,10 +217,40 @@ class DynamicAnchorKeyword(Keyword):
 
 
 class DefsKeyword(Keyword, ObjectOfSubschemas):
+    __slots__ = ()
     key = "$defs"
     static = True
 
 
 class CommentKeyword(Keyword):
+    __slots__ = ()
     key = "$comment"
     static = True
+
+
+@lru_cache(maxsize=1024)
+def _parse_uri(value: str) -> URI:
+    # the same metaschema, vocabulary and reference URIs recur across
+    # schemas; a URI is never modified in place, so instances can be shared
+    return URI(value)
+
+
+@lru_cache(maxsize=256)
+def _parse_absolute_uri(value: str) -> URI:
+    # as above, for the metaschema and vocabulary URIs, which must be
+    # absolute and normalized; only URIs that pass validation are cached,
+    # since a URIError propagates out of the cached call
+    (uri := URI(value)).validate(require_scheme=True, require_normalized=True)
+    return uri
+
+
+_plain_anchor = re.compile(r'[A-Za-z_][-A-Za-z0-9._]*')
+
+
+def _anchor_uri(base_uri: URI, anchor: str) -> URI:
+    # an anchor of the form required by the metaschemas needs no percent-
+    # encoding, so it can be attached to a base URI that has no fragment
+    # without re-parsing
+    if base_uri.fragment is None and isinstance(anchor, str) and _plain_anchor.fullmatch(anchor):
+        return base_uri.copy(fragment=anchor)
+    return URI(f'{base_uri}#{anchor}')
@@ -12,6 +12,7 @@ __all__ = [
 
 
 class FormatKeyword(Keyword):
+    __slots__ = ('validator', 'validates_types')
     key = "format"
 
     def __init__(self, parentschema: JSONSchema, value: str):
@@ -27,7 +28,7 @@ class FormatKeyword(Keyword):
             try:
                 self.validator(instance.data)
             except ValueError as e:
-                result.fail(f'The instance is invalid against the "{self.json.data}" format: {e}')
+                result.fail('The instance is invalid against the "{}" format: {}', self.json.data, str(e))
         else:
             result.noassert()
 
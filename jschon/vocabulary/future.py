@@ -9,6 +9,7 @@ __all__ = [
 
 
 class IdKeyword_Next(Keyword):
+    __slots__ = ()
     key = "$id"
     static = True
 
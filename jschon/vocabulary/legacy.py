@@ -1,5 +1,8 @@
+from itertools import chain, islice
+from typing import Mapping, Optional, Tuple, Union
+
 from jschon.exc import JSONSchemaError
-from jschon.json import JSON
+from jschon.json import JSON, JSONCompatible
 from jschon.jsonschema import JSONSchema, Result
 from jschon.vocabulary import ArrayOfSubschemas, Keyword, Subschema
 
@@ -14,6 +17,7 @@ __all__ = [
 
 
 class RecursiveRefKeyword_2019_09(Keyword):
+    __slots__ = ('refschema', '_recursive')
     key = "$recursiveRef"
 
     def __init__(self, parentschema: JSONSchema, value: str):
@@ -22,6 +26,7 @@ class RecursiveRefKeyword_2019_09(Keyword):
             raise JSONSchemaError(f'"$recursiveRef" may only take the value "#"')
 
         self.refschema = None
+        self._recursive = False
 
     def resolve(self) -> None:
         if (base_uri := self.parentschema.base_uri) is not None:
@@ -31,29 +36,33 @@ class RecursiveRefKeyword_2019_09(Keyword):
         else:
             raise JSONSchemaError(f'No base URI against which to resolve "$recursiveRef"')
 
+        # the dynamic scope is only searched if the initial target
+        # has "$recursiveAnchor": true
+        self._recursive = bool(
+            (recursive_anchor := self.refschema.get("$recursiveAnchor")) and
+            recursive_anchor.data is True
+        )
+
     def evaluate(self, instance: JSON, result: Result) -> None:
         refschema = self.refschema
-        if (recursive_anchor := refschema.get("$recursiveAnchor")) and \
-                recursive_anchor.data is True:
-
-            target = result
-            while target is not None:
+        if self._recursive:
+            for target in result.dynamic_scope():
                 if (base_anchor := target.schema.get("$recursiveAnchor")) and \
                         base_anchor.data is True:
                     refschema = target.schema
 
-                target = target.parent
-
         refschema.evaluate(instance, result)
         result.refschema(refschema)
 
 
 class RecursiveAnchorKeyword_2019_09(Keyword):
+    __slots__ = ()
     key = "$recursiveAnchor"
     static = True
 
 
 class ItemsKeyword_2019_09(Keyword, Subschema, ArrayOfSubschemas):
+    __slots__ = ()
     key = "items"
     instance_types = "array",
 
@@ -65,8 +74,9 @@ class ItemsKeyword_2019_09(Keyword, Subschema, ArrayOfSubschemas):
             self.json.evaluate(instance, result)
 
         elif isinstance(self.json, JSONSchema):
+            evaluate_item = self.json.evaluate
             for index, item in enumerate(instance):
-                self.json.evaluate(item, result)
+                evaluate_item(item, result)
 
             if result.passed:
                 result.annotate(True)
@@ -74,11 +84,13 @@ class ItemsKeyword_2019_09(Keyword, Subschema, ArrayOfSubschemas):
         elif self.json.type == "array":
             annotation = None
             error = []
-            for index, item in enumerate(instance[:len(self.json)]):
+            for index, (item, subschema) in enumerate(zip(instance, self.json)):
                 annotation = index
+                if subschema._always_valid and not result.annotations_required():
+                    continue
                 with result(item, str(index)) as subresult:
-                    if not self.json[index].evaluate(item, subresult).passed:
-                        error += [index]
+                    if not subschema.evaluate(item, subresult).passed:
+                        error.append(index)
 
             if error:
                 result.fail(error)
@@ -87,19 +99,22 @@ class ItemsKeyword_2019_09(Keyword, Subschema, ArrayOfSubschemas):
 
 
 class AdditionalItemsKeyword_2019_09(Keyword, Subschema):
+    __slots__ = ()
     key = "additionalItems"
     instance_types = "array",
     depends_on = "items",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        if (items := result.sibling(instance, "items")) and type(items.annotation) is int:
+        if "items" in self._sibling_keys and \
+                (items := result.sibling(instance, "items")) and type(items.annotation) is int:
             annotation = None
             error = []
-            for index, item in enumerate(instance[(start := items.annotation + 1):], start):
-                if self.json.evaluate(item, result).passed:
+            evaluate_item = self.json.evaluate
+            for index, item in enumerate(islice(instance, (start := items.annotation + 1), None), start):
+                if evaluate_item(item, result).passed:
                     annotation = True
                 else:
-                    error += [index]
+                    error.append(index)
                     # reset to passed for the next iteration
                     result.pass_()
 
@@ -113,6 +128,7 @@ class AdditionalItemsKeyword_2019_09(Keyword, Subschema):
 
 
 class UnevaluatedItemsKeyword_2019_09(Keyword, Subschema):
+    __slots__ = ()
     key = "unevaluatedItems"
     instance_types = "array",
     depends_on = (
@@ -131,30 +147,23 @@ class UnevaluatedItemsKeyword_2019_09(Keyword, Subschema):
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         last_evaluated_item = -1
-        for items_annotation in result.parent.collect_annotations(instance, "items"):
-            if items_annotation is True:
-                result.discard()
-                return
-            if type(items_annotation) is int and items_annotation > last_evaluated_item:
-                last_evaluated_item = items_annotation
-
-        for additional_items_annotation in result.parent.collect_annotations(instance, "additionalItems"):
-            if additional_items_annotation is True:
-                result.discard()
-                return
-
-        for unevaluated_items_annotation in result.parent.collect_annotations(instance, "unevaluatedItems"):
-            if unevaluated_items_annotation is True:
+        for _, annotation in result.parent.collect_annotations_by_key(
+                instance, "items", "additionalItems", "unevaluatedItems"
+        ):
+            if annotation is True:
                 result.discard()
                 return
+            if type(annotation) is int and annotation > last_evaluated_item:
+                last_evaluated_item = annotation
 
         annotation = None
         error = []
-        for index, item in enumerate(instance[(start := last_evaluated_item + 1):], start):
-            if self.json.evaluate(item, result).passed:
+        evaluate_item = self.json.evaluate
+        for index, item in enumerate(islice(instance, (start := last_evaluated_item + 1), None), start):
+            if evaluate_item(item, result).passed:
                 annotation = True
             else:
-                error += [index]
+                error.append(index)
                 # reset to passed for the next iteration
                 result.pass_()
 
@@ -165,6 +174,7 @@ class UnevaluatedItemsKeyword_2019_09(Keyword, Subschema):
 
 
 class UnevaluatedPropertiesKeyword_2019_09(Keyword, Subschema):
+    __slots__ = ('_adjacent_keys',)
     key = "unevaluatedProperties"
     instance_types = "object",
     depends_on = (
@@ -183,25 +193,38 @@ class UnevaluatedPropertiesKeyword_2019_09(Keyword, Subschema):
         "$recursiveRef",
     )
 
+    def __init__(self, parentschema: JSONSchema, value: Union[bool, Mapping[str, JSONCompatible]]):
+        super().__init__(parentschema, value)
+        # when "additionalProperties" is adjacent, every property of the instance
+        # has been evaluated by these keywords if all of them have passed
+        self._adjacent_keys: Optional[Tuple[str, ...]] = tuple(
+            key for key in ("properties", "patternProperties", "additionalProperties")
+            if key in self._sibling_keys
+        ) if "additionalProperties" in self._sibling_keys else None
+
     def evaluate(self, instance: JSON, result: Result) -> None:
-        evaluated_names = set()
-        for properties_annotation in result.parent.collect_annotations(instance, "properties"):
-            evaluated_names |= set(properties_annotation)
-        for pattern_properties_annotation in result.parent.collect_annotations(instance, "patternProperties"):
-            evaluated_names |= set(pattern_properties_annotation)
-        for additional_properties_annotation in result.parent.collect_annotations(instance, "additionalProperties"):
-            evaluated_names |= set(additional_properties_annotation)
-        for unevaluated_properties_annotation in result.parent.collect_annotations(instance, "unevaluatedProperties"):
-            evaluated_names |= set(unevaluated_properties_annotation)
+        if self._adjacent_keys is not None and all(
+                (sibling := result.sibling(instance, key)) is not None and sibling.valid
+                for key in self._adjacent_keys
+        ):
+            result.annotate([])
+            return
+
+        evaluated_names = frozenset(chain.from_iterable(
+            annotation for _, annotation in result.parent.collect_annotations_by_key(
+                instance, "properties", "patternProperties", "additionalProperties", "unevaluatedProperties"
+            )
+        ))
 
         annotation = []
         error = []
+        evaluate_item = self.json.evaluate
         for name, item in instance.items():
             if name not in evaluated_names:
-                if self.json.evaluate(item, result).passed:
-                    annotation += [name]
+                if evaluate_item(item, result).passed:
+                    annotation.append(name)
                 else:
-                    error += [name]
+                    error.append(name)
                     # reset to passed for the next iteration
                     result.pass_()
 
@@ -31,6 +31,7 @@ __all__ = [
 
 
 class TypeKeyword(Keyword):
+    __slots__ = ()
     key = "type"
 
     def evaluate(self, instance: JSON, result: Result) -> None:
@@ -43,10 +44,11 @@ class TypeKeyword(Keyword):
             valid = False
 
         if not valid:
-            result.fail(f"The instance must be of type {self.json}")
+            result.fail("The instance must be of type {}", self.json)
 
 
 class EnumKeyword(Keyword):
+    __slots__ = ()
     key = "enum"
 
     def evaluate(self, instance: JSON, result: Result) -> None:
@@ -56,80 +58,89 @@ class EnumKeyword(Keyword):
 
 
 class ConstKeyword(Keyword):
+    __slots__ = ()
     key = "const"
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if instance != self.json:
-            result.fail(f"The instance value must be equal to the defined constant")
+            result.fail("The instance value must be equal to the defined constant")
 
 
 class MultipleOfKeyword(Keyword):
+    __slots__ = ()
     key = "multipleOf"
     instance_types = "number",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         try:
             if Decimal(f'{instance.data}') % Decimal(f'{self.json.data}') != 0:
-                result.fail(f"The value must be a multiple of {self.json}")
+                result.fail("The value must be a multiple of {}", self.json)
         except InvalidOperation:
-            result.fail(f"Invalid operation: {instance} % {self.json}")
+            result.fail("Invalid operation: {} % {}", instance, self.json)
 
 
 class MaximumKeyword(Keyword):
+    __slots__ = ()
     key = "maximum"
     instance_types = "number",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if instance > self.json:
-            result.fail(f"The value may not be greater than {self.json}")
+            result.fail("The value may not be greater than {}", self.json)
 
 
 class ExclusiveMaximumKeyword(Keyword):
+    __slots__ = ()
     key = "exclusiveMaximum"
     instance_types = "number",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if instance >= self.json:
-            result.fail(f"The value must be less than {self.json}")
+            result.fail("The value must be less than {}", self.json)
 
 
 class MinimumKeyword(Keyword):
+    __slots__ = ()
     key = "minimum"
     instance_types = "number",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if instance < self.json:
-            result.fail(f"The value may not be less than {self.json}")
+            result.fail("The value may not be less than {}", self.json)
 
 
 class ExclusiveMinimumKeyword(Keyword):
+    __slots__ = ()
     key = "exclusiveMinimum"
     instance_types = "number",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if instance <= self.json:
-            result.fail(f"The value must be greater than {self.json}")
+            result.fail("The value must be greater than {}", self.json)
 
 
 class MaxLengthKeyword(Keyword):
+    __slots__ = ()
     key = "maxLength"
     instance_types = "string",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if len(instance) > self.json:
-            result.fail(f"The text is too long (maximum {self.json} characters)")
+            result.fail("The text is too long (maximum {} characters)", self.json)
 
 
 class MinLengthKeyword(Keyword):
+    __slots__ = ()
     key = "minLength"
     instance_types = "string",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if len(instance) < self.json:
-            result.fail(f"The text is too short (minimum {self.json} characters)")
+            result.fail("The text is too short (minimum {} characters)", self.json)
 
 
 class PatternKeyword(Keyword):
+    __slots__ = ('regex',)
     key = "pattern"
     instance_types = "string",
 
@@ -139,28 +150,31 @@ class PatternKeyword(Keyword):
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if self.regex.search(instance.data) is None:
-            result.fail(f"The text must match the regular expression {self.json}")
+            result.fail("The text must match the regular expression {}", self.json)
 
 
 class MaxItemsKeyword(Keyword):
+    __slots__ = ()
     key = "maxItems"
     instance_types = "array",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if len(instance) > self.json:
-            result.fail(f"The array has too many elements (maximum {self.json})")
+            result.fail("The array has too many elements (maximum {})", self.json)
 
 
 class MinItemsKeyword(Keyword):
+    __slots__ = ()
     key = "minItems"
     instance_types = "array",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if len(instance) < self.json:
-            result.fail(f"The array has too few elements (minimum {self.json})")
+            result.fail("The array has too few elements (minimum {})", self.json)
 
 
 class UniqueItemsKeyword(Keyword):
+    __slots__ = ()
     key = "uniqueItems"
     instance_types = "array",
 
@@ -171,31 +185,33 @@ class UniqueItemsKeyword(Keyword):
         uniquified = []
         for item in instance:
             if item not in uniquified:
-                uniquified += [item]
+                uniquified.append(item)
 
         if len(instance) > len(uniquified):
             result.fail("The array's elements must all be unique")
 
 
 class MaxContainsKeyword(Keyword):
+    __slots__ = ()
     key = "maxContains"
     instance_types = "array",
     depends_on = "contains",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        if contains := result.sibling(instance, "contains"):
+        if "contains" in self._sibling_keys and (contains := result.sibling(instance, "contains")):
             if contains.annotation is not None and len(contains.annotation) > self.json:
                 result.fail('The array has too many elements matching the '
-                            f'"contains" subschema (maximum {self.json})')
+                            '"contains" subschema (maximum {})', self.json)
 
 
 class MinContainsKeyword(Keyword):
+    __slots__ = ()
     key = "minContains"
     instance_types = "array",
     depends_on = "contains", "maxContains",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        if contains := result.sibling(instance, "contains"):
+        if "contains" in self._sibling_keys and (contains := result.sibling(instance, "contains")):
             contains_count = len(contains.annotation) \
                 if contains.annotation is not None \
                 else 0
@@ -203,54 +219,60 @@ class MinContainsKeyword(Keyword):
             valid = contains_count >= self.json
 
             if valid and not contains.valid:
-                max_contains = result.sibling(instance, "maxContains")
+                max_contains = "maxContains" in self._sibling_keys and result.sibling(instance, "maxContains")
                 if not max_contains or max_contains.valid:
                     contains.pass_()
 
             if not valid:
                 result.fail('The array has too few elements matching the '
-                            f'"contains" subschema (minimum {self.json})')
+                            '"contains" subschema (minimum {})', self.json)
 
 
 class MaxPropertiesKeyword(Keyword):
+    __slots__ = ()
     key = "maxProperties"
     instance_types = "object",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if len(instance) > self.json:
-            result.fail(f"The object has too many properties (maximum {self.json})")
+            result.fail("The object has too many properties (maximum {})", self.json)
 
 
 class MinPropertiesKeyword(Keyword):
+    __slots__ = ()
     key = "minProperties"
     instance_types = "object",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         if len(instance) < self.json:
-            result.fail(f"The object has too few properties (minimum {self.json})")
+            result.fail("The object has too few properties (minimum {})", self.json)
 
 
 class RequiredKeyword(Keyword):
+    __slots__ = ()
     key = "required"
     instance_types = "object",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
-        missing = [name.value for name in self.json if name.data not in instance]
+        properties = instance.data
+        missing = [name.value for name in self.json if name.data not in properties]
         if missing:
-            result.fail(f"The object is missing required properties {missing}")
+            result.fail("The object is missing required properties {}", missing)
 
 
 class DependentRequiredKeyword(Keyword):
+    __slots__ = ()
     key = "dependentRequired"
     instance_types = "object",
 
     def evaluate(self, instance: JSON, result: Result) -> None:
         missing = {}
+        properties = instance.data
         for name, dependents in self.json.items():
-            if name in instance:
-                missing_deps = [dep for dep in dependents if dep.data not in instance]
+            if name in properties:
+                missing_deps = [dep for dep in dependents if dep.data not in properties]
                 if missing_deps:
                     missing[name] = missing_deps
 
         if missing:
-            result.fail(f"The object is missing dependent properties {missing}")
+            result.fail("The object is missing dependent properties {}", missing)
@@ -2,6 +2,7 @@ import pytest
 
 from jschon.json import JSON
 from jschon.jsonschema import JSONSchema
+from jschon.vocabulary.applicator import AllOfKeyword, OneOfKeyword, PatternPropertiesKeyword, PropertyNamesKeyword
 from tests import metaschema_uri_2020_12
 
 
@@ -99,3 +100,429 @@ def test_items(example, expected_error_paths):
         error['keywordLocation'] for error in result.output('basic')['errors']
     }
     assert actual_error_paths == expected_error_paths
+
+
+@pytest.mark.parametrize('example, evaluated_indices, all_indices', [
+    ({"anyOf": [{"type": "object"}, {"required": ["foo"]}]}, {"0"}, {"0", "1"}),
+    ({"anyOf": [{"type": "string"}, {"type": "object"}, {"required": ["foo"]}]}, {"0", "1"}, {"0", "1", "2"}),
+    ({"anyOf": [{"properties": {"foo": True}}, {"properties": {"bar": True}}],
+      "unevaluatedProperties": False}, {"0", "1"}, {"0", "1"}),
+    ({"allOf": [{"anyOf": [{"properties": {"foo": True}}, {"properties": {"bar": True}}]}],
+      "unevaluatedProperties": False}, {"0", "1"}, {"0", "1"}),
+    ({"$ref": "#/$defs/foobar",
+      "$defs": {"foobar": {"anyOf": [{"properties": {"foo": True}}, {"properties": {"bar": True}}]}},
+      "unevaluatedProperties": False}, {"0", "1"}, {"0", "1"}),
+])
+@pytest.mark.parametrize('collect_annotations', [True, False])
+def test_any_of_short_circuit(example, evaluated_indices, all_indices, collect_annotations):
+    schema = JSONSchema(example, metaschema_uri=metaschema_uri_2020_12)
+    result = schema.evaluate(JSON({"foo": 1, "bar": 2}), collect_annotations=collect_annotations)
+    assert result.valid is True
+    if collect_annotations:
+        # every subschema is evaluated, so that all annotations are collected
+        evaluated_indices = all_indices
+
+    def find_any_of(node):
+        if node.key == "anyOf":
+            return node
+        for child in node.children.values():
+            if found := find_any_of(child):
+                return found
+
+    any_of_result = find_any_of(result)
+    assert {key for key, _ in any_of_result.children} == evaluated_indices
+
+
+@pytest.mark.parametrize('leaf, evaluation_count', [
+    ({"type": "object", "required": ["foo"]}, 1),
+    ({"$dynamicRef": "#leaf"}, 2),
+])
+def test_evaluation_cache(leaf, evaluation_count, monkeypatch):
+    schema = JSONSchema({
+        "$id": "https://example.com/cached",
+        "$defs": {
+            "shared": {"allOf": [leaf]},
+            "leaf": {"$dynamicAnchor": "leaf", "type": "object", "required": ["foo"]},
+        },
+        "allOf": [{"$ref": "#/$defs/shared"}],
+        "anyOf": [{"$ref": "#/$defs/shared"}],
+    }, metaschema_uri=metaschema_uri_2020_12)
+    leafschema = schema["$defs"]["shared"]["allOf"][0]
+    evaluations = []
+    evaluate = JSONSchema.evaluate
+
+    def counting_evaluate(self, instance, result=None):
+        if self is leafschema:
+            evaluations.append(instance.path)
+        return evaluate(self, instance, result)
+
+    monkeypatch.setattr(JSONSchema, 'evaluate', counting_evaluate)
+    result = schema.evaluate(JSON({"bar": 1}))
+    assert len(evaluations) == evaluation_count
+    assert not result.valid
+    error_locations = {error['keywordLocation'] for error in result.output('basic')['errors']}
+    assert {"/allOf/0/$ref/allOf", "/anyOf/0/$ref/allOf"} <= error_locations
+
+
+def test_evaluation_cache_ref(monkeypatch):
+    schema = JSONSchema({
+        "$defs": {
+            "shared": {"type": "object", "required": ["foo"]},
+        },
+        "allOf": [{"$ref": "#/$defs/shared", "minProperties": 1}],
+        "anyOf": [{"$ref": "#/$defs/shared", "maxProperties": 5}],
+    }, metaschema_uri=metaschema_uri_2020_12)
+    sharedschema = schema["$defs"]["shared"]
+    evaluations = []
+    evaluate = JSONSchema.evaluate
+
+    def counting_evaluate(self, instance, result=None):
+        if self is sharedschema:
+            evaluations.append(instance.path)
+        return evaluate(self, instance, result)
+
+    monkeypatch.setattr(JSONSchema, 'evaluate', counting_evaluate)
+    result = schema.evaluate(JSON({"bar": 1}))
+    assert len(evaluations) == 1
+    assert not result.valid
+    error_locations = {error['keywordLocation'] for error in result.output('basic')['errors']}
+    assert {"/allOf/0/$ref/required", "/anyOf/0/$ref/required"} <= error_locations
+
+
+@pytest.mark.parametrize('instval, pattern_properties_valid, additional_names', [
+    ({"foo": 1, "fox": 2, "bar": 3, "baz": 4}, True, {"baz"}),
+    ({"foo": 1, "fox": "two", "bar": 3, "baz": 4}, False, {"baz"}),
+    ({"bar": 1}, True, set()),
+])
+def test_additional_properties_with_pattern_properties(instval, pattern_properties_valid, additional_names):
+    schema = JSONSchema({
+        "properties": {"bar": True},
+        "patternProperties": {"^f": {"type": "integer"}},
+        "additionalProperties": {"type": "integer"},
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON(instval)
+    result = schema.evaluate(instance)
+    assert result.children["patternProperties", instance.path].valid is pattern_properties_valid
+    additional_properties = result.children["additionalProperties", instance.path]
+    assert additional_properties.valid is True
+    assert set(additional_properties.annotation) == additional_names
+
+
+@pytest.mark.parametrize('example, annotation', [
+    ({"contains": {"type": "integer"}}, [1]),
+    ({"contains": {"type": "integer"}, "maxContains": 3}, [1, 2, 4]),
+    ({"contains": {"type": "integer"}, "minContains": 2}, [1, 2]),
+    ({"contains": {"type": "integer"}, "minContains": 0}, [1]),
+    ({"contains": {"type": "integer"}, "minContains": 2, "maxContains": 3}, [1, 2, 4]),
+    ({"contains": {"type": "integer"}, "unevaluatedItems": {"type": "string"}}, [1, 2, 4]),
+    ({"allOf": [{"contains": {"type": "integer"}}], "unevaluatedItems": {"type": "string"}}, [1, 2, 4]),
+])
+def test_contains_short_circuit(example, annotation):
+    schema = JSONSchema(example, metaschema_uri=metaschema_uri_2020_12)
+    result = schema.evaluate(JSON(["a", 1, 2, "b", 3]), collect_annotations=False)
+    assert result.valid is True
+    assert list(result.collect_annotations(key="contains")) == [annotation]
+
+    # all matching items are annotated when annotations are collected
+    result = schema.evaluate(JSON(["a", 1, 2, "b", 3]))
+    assert result.valid is True
+    assert list(result.collect_annotations(key="contains")) == [[1, 2, 4]]
+
+
+def test_all_of_fail_fast(monkeypatch):
+    monkeypatch.setattr(AllOfKeyword, 'fail_fast', True)
+    schema = JSONSchema({
+        "allOf": [{"type": "object"}, {"required": ["foo"]}, {"required": ["bar"]}],
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON({})
+
+    result = schema.evaluate(instance)
+    assert result.valid is False
+    assert [key for key, _ in result.children["allOf", instance.path].children] == ["0", "1"]
+
+    # subschemas are evaluated in declaration order, regardless of earlier failures
+    result = schema.evaluate(JSON({"foo": 1}))
+    assert result.valid is False
+    assert [key for key, _ in result.children["allOf", result.instance.path].children] == ["0", "1", "2"]
+
+    result = schema.evaluate(instance)
+    assert result.valid is False
+    assert [key for key, _ in result.children["allOf", instance.path].children] == ["0", "1"]
+
+    assert schema.evaluate(JSON({"foo": 1, "bar": 2})).valid is True
+
+
+@pytest.mark.parametrize('instval, valid', [
+    ({"foo": 1}, False),
+    ({"bar": 1}, True),
+])
+def test_evaluation_cache_not(instval, valid, monkeypatch):
+    schema = JSONSchema({
+        "$defs": {"shared": {"not": {"required": ["foo"]}}},
+        "allOf": [{"$ref": "#/$defs/shared"}],
+        "anyOf": [{"$ref": "#/$defs/shared"}],
+    }, metaschema_uri=metaschema_uri_2020_12)
+    notschema = schema["$defs"]["shared"]["not"]
+    evaluations = []
+    evaluate = JSONSchema.evaluate
+
+    def counting_evaluate(self, instance, result=None):
+        if self is notschema:
+            evaluations.append(instance.path)
+        return evaluate(self, instance, result)
+
+    monkeypatch.setattr(JSONSchema, 'evaluate', counting_evaluate)
+    instance = JSON(instval)
+    result = schema.evaluate(instance)
+    assert len(evaluations) == 1
+    assert result.valid is valid
+    assert result.children["allOf", instance.path].valid is valid
+    assert result.children["anyOf", instance.path].valid is valid
+
+
+@pytest.mark.parametrize('patterns', [
+    ["^f", "o$"],
+    ["^(f)\\1", "o$"],
+    ["(?i)^F", "o$"],
+])
+def test_additional_properties_with_invalid_pattern_properties(patterns):
+    schema = JSONSchema({
+        "patternProperties": {pattern: False for pattern in patterns},
+        "additionalProperties": {"type": "integer"},
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON({"ffoo": 1, "bar": 2, "zoo": 3})
+    result = schema.evaluate(instance)
+    assert result.children["patternProperties", instance.path].valid is False
+    additional_properties = result.children["additionalProperties", instance.path]
+    assert additional_properties.valid is True
+    assert set(additional_properties.annotation) == {"bar"}
+
+
+@pytest.mark.parametrize('key, error', [
+    ("allOf", "The instance is invalid against subschemas [0]"),
+    ("anyOf", "The instance must be valid against at least one subschema"),
+    ("oneOf", "The instance must be valid against exactly one subschema; "
+              "it is valid against [] and invalid against [0]"),
+])
+def test_single_subschema(key, error):
+    schema = JSONSchema({key: [{"type": "string"}]}, metaschema_uri=metaschema_uri_2020_12)
+    assert schema.evaluate(JSON("valid")).valid is True
+    instance = JSON(1)
+    result = schema.evaluate(instance)
+    assert result.valid is False
+    assert result.children[key, instance.path].error == error
+
+
+@pytest.mark.parametrize('extra_patterns', [
+    {},
+    {"^(x)\\1": False},
+])
+@pytest.mark.parametrize('instval, valid, matched_names', [
+    ({"foo": 1, "bar": "x", "baz": 2}, True, {"foo", "bar"}),
+    ({"foo": "x", "bar": "x", "baz": 2}, False, None),
+    ({"baz": 2}, True, set()),
+])
+def test_pattern_properties(extra_patterns, instval, valid, matched_names):
+    schema = JSONSchema({
+        "patternProperties": {"^f": {"type": "integer"}, "r$": {"type": "string"}, **extra_patterns},
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON(instval)
+    result = schema.evaluate(instance)
+    assert result.valid is valid
+    annotation = result.children["patternProperties", instance.path].annotation
+    assert (set(annotation) if annotation is not None else None) == matched_names
+
+
+@pytest.mark.parametrize('instval', [
+    {"a": 1, "b": 2},
+    {"a": 1, "b": 2, "c": 3, "d": 4},
+])
+def test_properties_instance_order(instval):
+    schema = JSONSchema({
+        "properties": {"b": {"type": "integer"}, "a": {"type": "integer"}},
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON(instval)
+    result = schema.evaluate(instance)
+    assert result.valid is True
+    properties_result = result.children["properties", instance.path]
+    assert properties_result.annotation == ["a", "b"]
+    assert [key for key, _ in properties_result.children] == ["a", "b"]
+
+
+@pytest.mark.parametrize('instval, valid, unevaluated_names', [
+    ({"foo": 1, "bar": 2}, True, []),
+    ({"foo": "x", "bar": 2}, False, ["foo"]),
+    ({"foo": 1, "bar": "x"}, False, ["bar"]),
+])
+def test_unevaluated_properties_with_additional_properties(instval, valid, unevaluated_names):
+    schema = JSONSchema({
+        "properties": {"foo": {"type": "integer"}},
+        "additionalProperties": {"type": "integer"},
+        "unevaluatedProperties": True,
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON(instval)
+    result = schema.evaluate(instance)
+    assert result.valid is valid
+    assert result.children["unevaluatedProperties", instance.path].annotation == unevaluated_names
+
+
+def test_property_names_instance_location():
+    schema = JSONSchema({"propertyNames": {"maxLength": 3}}, metaschema_uri=metaschema_uri_2020_12)
+    result = schema.evaluate(JSON({"foo": 1, "toolong": {"bar": 2}}))
+    assert result.valid is False
+    assert {
+        error["instanceLocation"]
+        for error in result.output("basic")["errors"]
+        if error["keywordLocation"] == "/propertyNames/maxLength"
+    } == {"/toolong"}
+
+
+@pytest.mark.parametrize('collect_annotations, collect_all_results, evaluated_indices, error', [
+    (False, False, {"0", "1", "2"}, "The instance must be valid against exactly one subschema; "
+                                    "it is valid against at least [0, 2]"),
+    (False, True, {"0", "1", "2", "3"}, "The instance must be valid against exactly one subschema; "
+                                        "it is valid against [0, 2, 3] and invalid against [1]"),
+    (True, False, {"0", "1", "2", "3"}, "The instance must be valid against exactly one subschema; "
+                                        "it is valid against [0, 2, 3] and invalid against [1]"),
+])
+def test_one_of_short_circuit(collect_annotations, collect_all_results, evaluated_indices, error, monkeypatch):
+    monkeypatch.setattr(OneOfKeyword, 'collect_all_results', collect_all_results)
+    schema = JSONSchema({
+        "oneOf": [{"type": "integer"}, {"type": "string"}, {"minimum": 1}, {"maximum": 3}],
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON(2)
+    result = schema.evaluate(instance, collect_annotations=collect_annotations)
+    assert result.valid is False
+    one_of_result = result.children["oneOf", instance.path]
+    assert {key for key, _ in one_of_result.children} == evaluated_indices
+    assert one_of_result.error == error
+
+
+@pytest.mark.parametrize('subschema, always_valid', [
+    (True, True),
+    ({}, True),
+    ({"$comment": "static keywords are not evaluated"}, True),
+    (False, False),
+    ({"type": "integer"}, False),
+])
+@pytest.mark.parametrize('collect_annotations', [True, False])
+def test_always_valid_subschema(subschema, always_valid, collect_annotations):
+    schema = JSONSchema({
+        "properties": {"foo": subschema},
+        "prefixItems": [subschema],
+    }, metaschema_uri=metaschema_uri_2020_12)
+    assert schema["properties"]["foo"]._always_valid is always_valid
+    # subresults are skipped for always-valid subschemas only if
+    # annotations are not being collected
+    skipped = always_valid and not collect_annotations
+
+    instance = JSON({"foo": 1})
+    result = schema.evaluate(instance, collect_annotations=collect_annotations)
+    properties_result = result.children["properties", instance.path]
+    assert properties_result.valid is (subschema is not False)
+    assert (properties_result.annotation == ["foo"]) is (subschema is not False)
+    assert (len(properties_result.children) == 0) is skipped
+
+    instance = JSON([1])
+    result = schema.evaluate(instance, collect_annotations=collect_annotations)
+    prefix_items_result = result.children["prefixItems", instance.path]
+    assert prefix_items_result.valid is (subschema is not False)
+    assert (len(prefix_items_result.children) == 0) is skipped
+
+
+def test_pattern_properties_match_cache(monkeypatch):
+    monkeypatch.setattr(PatternPropertiesKeyword, '_max_cached_matches', 2)
+    schema = JSONSchema({
+        "patternProperties": {"^f": {"type": "integer"}, "o$": {"minimum": 1}},
+    }, metaschema_uri=metaschema_uri_2020_12)
+    match = schema.keywords["patternProperties"]._match
+    assert schema.evaluate(JSON({"foo": 1, "bar": 1})).valid is True
+    assert schema.evaluate(JSON({"foo": 0, "bar": 1})).valid is False
+    # matches are cached by name
+    assert match.cache_info()[:2] == (2, 2)  # hits, misses
+    # up to the limit, dropping the least recently used names
+    assert schema.evaluate(JSON({"baz": "x", "foo": 2})).valid is True
+    assert match.cache_info()[:2] == (2, 4)
+    assert schema.evaluate(JSON({"foo": 3})).valid is True
+    assert match.cache_info()[:2] == (3, 4)
+    assert schema.evaluate(JSON({"bar": 1})).valid is True
+    assert match.cache_info()[:2] == (3, 5)
+    assert match("foo") == (("^f", schema["patternProperties"]["^f"]), ("o$", schema["patternProperties"]["o$"]))
+
+
+@pytest.mark.parametrize('instval', [
+    {"foo": 1, "fob": 2, "bar": 3, "fa": 4},
+    {"fa": 1, "bar": 2, "fob": 3, "foo": 4},
+])
+def test_pattern_properties_instance_order(instval):
+    schema = JSONSchema({
+        "patternProperties": {"^f": {"type": "integer"}, "o": {"minimum": 1}},
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON(instval)
+    result = schema.evaluate(instance)
+    assert result.valid is True
+    assert result.children["patternProperties", instance.path].annotation == [
+        name for name in instval if name.startswith("f")
+    ]
+
+
+@pytest.mark.parametrize('fail_fast, error', [
+    (False, ["bar", "baz"]),
+    (True, ["bar"]),
+])
+def test_property_names_fail_fast(fail_fast, error, monkeypatch):
+    monkeypatch.setattr(PropertyNamesKeyword, 'fail_fast', fail_fast)
+    schema = JSONSchema({
+        "propertyNames": {"maxLength": 2},
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON({"fo": 1, "bar": 2, "q": 3, "baz": 4})
+    result = schema.evaluate(instance)
+    assert result.valid is False
+    assert result.children["propertyNames", instance.path].error == error
+
+
+@pytest.mark.parametrize('key, instval, valid, evaluated_keys', [
+    ("allOf", 1, True, ["1"]),
+    ("allOf", "x", False, ["1"]),
+    ("anyOf", 1, True, []),
+    ("anyOf", "x", True, []),
+    ("oneOf", 1, False, ["1"]),
+    ("oneOf", "x", True, ["1"]),
+])
+def test_always_valid_subschema_in_array(key, instval, valid, evaluated_keys):
+    schema = JSONSchema({
+        key: [{}, {"type": "integer"}],
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON(instval)
+    result = schema.evaluate(instance, collect_annotations=False)
+    assert result.valid is valid
+    # always-valid subschemas are not evaluated
+    assert [k for k, _ in result.children[key, instance.path].children] == evaluated_keys
+
+
+@pytest.mark.parametrize('collect_annotations, evaluated_keys', [
+    (True, ["0", "1"]),
+    (False, []),
+])
+def test_always_valid_subschema_in_any_of(collect_annotations, evaluated_keys):
+    schema = JSONSchema({
+        "anyOf": [True, {"title": "foo"}, {"type": "string"}],
+    }, metaschema_uri=metaschema_uri_2020_12)
+    instance = JSON(1)
+    result = schema.evaluate(instance, collect_annotations=collect_annotations)
+    assert result.valid is True
+    # the subschemas are skipped only if their annotations are not needed
+    any_of_result = result.children["anyOf", instance.path]
+    assert [k for k, _ in any_of_result.children if any_of_result.children[k, instance.path].valid] \
+        == evaluated_keys
+    assert list(result.collect_annotations(key="title")) == (["foo"] if collect_annotations else [])
+
+
+def test_always_valid_subschema_in_any_of_with_annotations():
+    schema = JSONSchema({
+        "anyOf": [True, {"properties": {"foo": {"type": "integer"}}}],
+        "unevaluatedProperties": False,
+    }, metaschema_uri=metaschema_uri_2020_12)
+    # the other subschemas are still evaluated for their annotations
+    assert schema.evaluate(JSON({"foo": 1})).valid is True
+    assert schema.evaluate(JSON({"foo": 1, "bar": 1})).valid is False
@@ -258,6 +258,25 @@ def test_context_manager_no_id(catalog):
         assert isinstance(cache_id, uuid.UUID)
 
 
+def test_schema_cache_version(catalog):
+    uri = URI("http://example.com/versioned")
+    version = catalog.schema_cache_version
+    cached_schema(uri, {"const": 0}, 'versioned')
+    assert catalog.schema_cache_version != version
+
+    version = catalog.schema_cache_version
+    catalog.del_schema(uri, cacheid='versioned')
+    assert catalog.schema_cache_version != version
+
+    version = catalog.schema_cache_version
+    with catalog.cache():
+        pass
+    assert catalog.schema_cache_version != version
+
+    with pytest.raises(AttributeError):
+        catalog.schema_cache_version = 0
+
+
 def test_del_schema_nonexistent_cache(catalog):
     dne = 'doesnotexist'
     assert dne not in catalog._schema_cache
@@ -242,6 +242,70 @@ def test_contains_if_output(input, output):
     assert result == output
 
 
+def test_any_of_output():
+    schema = JSONSchema({
+        "$id": "http://example.com",
+        "anyOf": [{"title": "foo"}, {"title": "bar"}, {"type": "string"}],
+    }, metaschema_uri=metaschema_uri_2020_12)
+    result = schema.evaluate(JSON(1)).output('basic')
+    assert result['valid'] is True
+    assert [annotation['keywordLocation'] for annotation in result['annotations']] == [
+        '/anyOf/0/title', '/anyOf/1/title',
+    ]
+
+
+always_valid_output_1 = {'valid': True,
+                         'instanceLocation': '',
+                         'keywordLocation': '',
+                         'absoluteKeywordLocation': 'http://example.com#',
+                         'annotations': [{'valid': True,
+                                          'instanceLocation': '',
+                                          'keywordLocation': '/allOf',
+                                          'absoluteKeywordLocation': 'http://example.com#/allOf',
+                                          'annotations': [{'valid': True,
+                                                           'instanceLocation': '',
+                                                           'keywordLocation': '/allOf/0',
+                                                           'absoluteKeywordLocation': 'http://example.com#/allOf/0'}]}]}
+always_valid_output_2 = {'valid': True,
+                         'instanceLocation': '',
+                         'keywordLocation': '',
+                         'absoluteKeywordLocation': 'http://example.com#',
+                         'annotations': [{'valid': True,
+                                          'instanceLocation': '',
+                                          'keywordLocation': '/properties',
+                                          'absoluteKeywordLocation': 'http://example.com#/properties',
+                                          'annotation': ['foo'],
+                                          'annotations': [{'valid': True,
+                                                           'instanceLocation': '/foo',
+                                                           'keywordLocation': '/properties/foo',
+                                                           'absoluteKeywordLocation': 'http://example.com#/properties/foo'}]}]}
+
+always_valid_output_3 = {'valid': True,
+                         'instanceLocation': '',
+                         'keywordLocation': '',
+                         'absoluteKeywordLocation': 'http://example.com#',
+                         'annotations': [{'valid': True,
+                                          'instanceLocation': '',
+                                          'keywordLocation': '/items',
+                                          'absoluteKeywordLocation': 'http://example.com#/items',
+                                          'annotation': 0,
+                                          'annotations': [{'valid': True,
+                                                           'instanceLocation': '/0',
+                                                           'keywordLocation': '/items/0',
+                                                           'absoluteKeywordLocation': 'http://example.com#/items/0'}]}]}
+
+
+@pytest.mark.parametrize('metaschema_uri, schema, input, output', [
+    (metaschema_uri_2020_12, {"allOf": [True]}, 1, always_valid_output_1),
+    (metaschema_uri_2020_12, {"properties": {"foo": {}}}, {"foo": 1}, always_valid_output_2),
+    (metaschema_uri_2019_09, {"items": [True]}, [1], always_valid_output_3),
+])
+def test_always_valid_subschema_output(metaschema_uri, schema, input, output):
+    schema = JSONSchema({"$id": "http://example.com", **schema}, metaschema_uri=metaschema_uri)
+    result = schema.evaluate(JSON(input)).output('verbose')
+    assert result == output
+
+
 # https://github.com/marksparkza/jschon/issues/15
 @pytest.mark.parametrize('foo_schema, valid', [
     (False, False),
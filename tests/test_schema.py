@@ -5,7 +5,9 @@ from hypothesis import given
 from pytest import param as p
 
 from jschon import JSON, JSONPointer, JSONSchema, URI, create_catalog
+from jschon.exc import JSONSchemaError
 from jschon.json import false, true
+from jschon.vocabulary.core import _anchor_uri
 from tests import example_invalid, example_schema, example_valid, metaschema_uri_2019_09, metaschema_uri_2020_12
 from tests.strategies import *
 
@@ -45,6 +47,17 @@ def test_invalid_schema(example):
     assert schema.validate().valid is False
 
 
+@pytest.mark.parametrize('metaschema_uri', [
+    "json-schema.org/draft/2020-12/schema",
+    "HTTPS://json-schema.org/draft/2020-12/schema",
+])
+def test_invalid_metaschema_uri(metaschema_uri):
+    # rejected every time, not only on first use of the URI
+    for _ in range(2):
+        with pytest.raises(JSONSchemaError):
+            JSONSchema({"$schema": metaschema_uri})
+
+
 @pytest.fixture
 def weird_parent_schema(catalog):
     return JSON(
@@ -346,3 +359,46 @@ def test_recursive_schema_extension_2020_12():
     tree_json = JSON(tree_instance_2020_12)
     assert tree_schema.evaluate(tree_json).valid is True
     assert strict_tree_schema.evaluate(tree_json).valid is False
+
+
+def test_dynamic_ref_target_cache():
+    tree_schema = JSONSchema(tree_2020_12)
+    strict_tree_schema = JSONSchema(strict_tree_2020_12)
+    tree_json = JSON(tree_instance_2020_12)
+    for _ in range(2):
+        assert tree_schema.evaluate(tree_json).valid is True
+        assert strict_tree_schema.evaluate(tree_json).valid is False
+
+    # replacing the strict-tree schema in the catalog must not leave the
+    # old one in use as the dynamic anchor target for its URI
+    lax_tree_schema = JSONSchema({**strict_tree_2020_12, "unevaluatedProperties": true})
+    assert lax_tree_schema.evaluate(tree_json).valid is True
+
+
+@pytest.mark.parametrize('base_uri', [
+    'https://example.com/anchor-uri',
+    'https://example.com/anchor-uri?x=1',
+    'https://example.com/anchor-uri#',
+    'https://example.com/anchor-uri#frag',
+    'https://example.com/é',
+    'urn:example:anchor-uri',
+])
+@pytest.mark.parametrize('anchor', ['foo', 'a.b-c_1', '_x', 'a b', 'é'])
+def test_anchor_uri_unchanged(base_uri, anchor):
+    # the URI must be the same as that obtained by parsing the concatenation
+    uri = _anchor_uri(URI(base_uri), anchor)
+    expected = URI(f'{URI(base_uri)}#{anchor}')
+    assert uri == expected
+    assert str(uri) == str(expected)
+
+
+@pytest.mark.parametrize('anchor', ['foo', 'a.b-c_1', 'a b', 'é'])
+def test_anchor_uri(anchor):
+    schema = JSONSchema({
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "$id": "https://example.com/anchor-uri",
+        "$defs": {"a": {"$anchor": anchor, "type": "integer"}},
+        "$ref": f"#{anchor}",
+    })
+    assert schema.evaluate(JSON(1)).valid is True
+    assert schema.evaluate(JSON("1")).valid is False